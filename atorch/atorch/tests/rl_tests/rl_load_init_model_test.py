@@ -1,11 +1,14 @@
 import copy
 import os
+import sys
 import tempfile
 import unittest
 
 import deepspeed
 import torch
+import torch.distributed as dist
 import torch.multiprocessing as mp
+from torch._utils import _flatten_dense_tensors
 from transformers import OPTConfig, OPTForCausalLM
 
 from atorch.common.util_func import find_free_port
@@ -24,20 +27,30 @@ def _load_ds_model_with_zero3_partition(rank, world_size):
     init_dist(rank, world_size)
     torch.manual_seed(0)
     opt_config = OPTConfig()
-    opt_model = OPTForCausalLM(opt_config)
-    opt_model_copy = copy.deepcopy(opt_model).to(rank)
-    folder = tempfile.mkdtemp()
+    # Only rank 0 instantiates the HF model and saves it. All ranks share
+    # the host, so every rank loads the reference model from the folder
+    # which is broadcast after rank 0 finishes saving.
+    torch.cuda.set_device(rank)
+    folder_list = [None]
+    if rank == 0:
+        opt_model = OPTForCausalLM(opt_config)
+        folder_list[0] = tempfile.mkdtemp()
+        opt_model.save_pretrained(folder_list[0])
+        del opt_model
+    dist.broadcast_object_list(folder_list, src=0, device=torch.device("cuda", rank))
+    opt_model_copy = OPTForCausalLM.from_pretrained(folder_list[0]).to(rank)
+    folder = folder_list[0]
     model_class = OPTForCausalLM
     model_config_class = OPTConfig
     model_config_folder = folder
-    opt_model.save_pretrained(folder)
     ds_config = {"train_batch_size": 4}
     model = load_ds_model_with_zero3_partition(
         model_class, model_config_class, model_config_folder=model_config_folder, ds_config_dict_or_path=ds_config
     )
     with deepspeed.zero.GatheredParameters(list(model.parameters(recurse=True)), modifier_rank=0):
-        for p1, p2 in zip(model.parameters(), opt_model_copy.parameters()):
-            assert torch.allclose(p1, p2, rtol=1e-05, atol=1e-08)
+        p1_flat = _flatten_dense_tensors([p.detach() for p in model.parameters()])
+        p2_flat = _flatten_dense_tensors([p.detach() for p in opt_model_copy.parameters()])
+        assert torch.allclose(p1_flat, p2_flat, rtol=1e-05, atol=1e-08)
     assert model is not None
     # opt model tie lm_head.weight with embed_tokens.weight by default
     config = {
@@ -63,11 +76,17 @@ class TestLoadDSModel(unittest.TestCase):
         world_size = 2
         os.environ["MASTER_ADDR"] = "localhost"  #
         os.environ["MASTER_PORT"] = str(find_free_port())
-        mp.spawn(
+        start_method = "spawn"
+        if sys.platform.startswith("linux"):
+            # Import the heavy modules once in the forkserver.
+            start_method = "forkserver"
+            mp.set_forkserver_preload(["torch", "deepspeed", "transformers"])
+        mp.start_processes(
             _load_ds_model_with_zero3_partition,
             args=(world_size,),
             nprocs=world_size,
             join=True,
+            start_method=start_method,
         )
 
 
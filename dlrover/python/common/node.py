@@ -12,6 +12,7 @@
 # limitations under the License.
 
 import copy
+import math
 import time
 
 from dlrover.python.common.constants import (
@@ -23,15 +24,21 @@ from dlrover.python.common.constants import (
 from dlrover.python.common.grpc import ParallelConfig
 from dlrover.python.common.serialize import JsonSerializable
 
+# The bit shift to convert the memory unit to MB.
+_MEMORY_UNIT_SHIFT = {"Ki": -10, "Mi": 0, "Gi": 10}
 
-def _is_float_str(str_number):
+
+def _parse_number(str_number):
+    """Parse the string to an int if it only has digits or a float.
+    Return None if the string is not a number."""
     if not str_number:
-        return False
+        return None
+    if isinstance(str_number, str) and str_number.isdigit():
+        return int(str_number)
     try:
-        float(str_number)
-        return True
+        return float(str_number)
     except ValueError:
-        return False
+        return None
 
 
 class NodeResource(JsonSerializable):
@@ -73,6 +80,17 @@ class NodeResource(JsonSerializable):
     ... )
     """
 
+    __slots__ = (
+        "cpu",
+        "memory",
+        "gpu_type",
+        "gpu_num",
+        "gpu_stats",
+        "kwargs",
+        "image",
+        "priority",
+    )
+
     def __init__(
         self,
         cpu,
@@ -92,35 +110,87 @@ class NodeResource(JsonSerializable):
         self.image = ""
         self.priority = priority
 
+    def to_dict(self):
+        return {name: getattr(self, name) for name in NodeResource.__slots__}
+
     def to_resource_dict(self):
-        resource = self.kwargs
-        resource["cpu"] = self.cpu
-        resource["memory"] = str(self.memory) + "Mi"
-        if self.gpu_num > 0:
-            resource[self.gpu_type] = self.gpu_num
-        return resource
+        memory = self.memory
+        if float(memory).is_integer():
+            memory = int(memory)
+        return {
+            **self.kwargs,
+            "cpu": self.cpu,
+            "memory": f"{memory}Mi",
+            **({self.gpu_type: self.gpu_num} if self.gpu_num > 0 else {}),
+        }
+
+    @staticmethod
+    def convert_memory_to_mb(memory: str):
+        """Convert the memory like "1Gi" or "512.5Mi" to the number of MB.
+        The memory without a unit is regarded as MB.
+
+        Note: it differs from `convert_memory_to_mb` in
+        `dlrover.python.scheduler.kubernetes`, which parses any k8s
+        quantity and regards the memory without a unit as bytes. This
+        module cannot import it because the kubernetes module imports
+        this one, and the common module should not depend on the
+        kubernetes client.
+        """
+        if memory[-1:].isdigit():
+            number, shift = memory, 0
+        else:
+            number, shift = memory[:-2], _MEMORY_UNIT_SHIFT.get(memory[-2:])
+            if shift is None:
+                raise ValueError(f"Unsupported memory unit in {memory}.")
+        value = _parse_number(number)
+        if value is None:
+            raise ValueError(f"Invalid memory {memory}.")
+        if isinstance(value, float):
+            return math.ldexp(value, shift)
+        return value << shift if shift >= 0 else value >> -shift
 
     @classmethod
     def resource_str_to_node_resource(cls, resource_str):
         """Convert the resource configuration like "memory=100Mi,cpu=5"
         to a NodeResource instance."""
-        resource = {}
         if not resource_str:
             return NodeResource(0, 0)
-        for value in resource_str.strip().split(","):
-            resource[value.split("=")[0]] = value.split("=")[1]
-
-        memory = float(resource.get("memory", "0Mi")[0:-2])
-        cpu = float(resource.get("cpu", "0"))
-        gpu_type = None
-        gpu_num = 0
-        for key, _ in resource.items():
-            if "nvidia.com" in key:
-                gpu_type = key
-                gpu_num = int(resource[key])
+        cpu, memory, gpu_type, gpu_num = 0.0, 0.0, None, 0
+        for kv in resource_str.strip().split(","):
+            key, _, value = kv.strip().partition("=")
+            if key == "cpu":
+                cpu = float(value)
+            elif key == "memory":
+                memory = cls.convert_memory_to_mb(value)
+            elif "nvidia.com" in key:
+                gpu_type, gpu_num = key, int(value)
         return NodeResource(cpu, memory, gpu_type, gpu_num)
 
 
+class _ZeroUsedResource(NodeResource):
+    """The read-only resource usage shared by nodes which have not reported
+    any usage. Setting its attributes raises an AttributeError and its
+    copies are mutable NodeResource instances."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        for name, value in NodeResource(0.0, 0.0).to_dict().items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "The zero used resource is shared and can not be modified, "
+            "please use Node.update_resource_usage."
+        )
+
+    def __reduce__(self):
+        return (NodeResource, (0.0, 0.0))
+
+
+_ZERO_USED_RESOURCE = _ZeroUsedResource()
+
+
 class NodeGroupResource(JsonSerializable):
     """The node group resource contains the number of the task
     and resource (cpu, memory) of each task.
@@ -146,6 +216,18 @@ class NodeGroupResource(JsonSerializable):
         return NodeGroupResource(0, NodeResource(0, 0))
 
 
+# The private slots of Node which are exposed by properties and the
+# property names used when serializing the node.
+_NODE_PROPERTY_SLOTS = {
+    "_relaunch_count": "relaunch_count",
+    "_max_relaunch_count": "max_relaunch_count",
+    "_exit_reason": "exit_reason",
+}
+
+# The slots of Node which are not serialized by `Node.to_dict`.
+_NODE_UNSERIALIZED_SLOTS = {"paral_config", "config_resource", "used_resource"}
+
+
 class Node(object):
     """Node records the information of each training node.
     Attributes:
@@ -168,6 +250,39 @@ class Node(object):
         unrecoverable_failure_msg: unrecoverable failure msg.
     """
 
+    __slots__ = (
+        "type",
+        "id",
+        "name",
+        "status",
+        "start_time",
+        "rank_index",
+        "_relaunch_count",
+        "critical",
+        "_max_relaunch_count",
+        "relaunchable",
+        "service_addr",
+        "create_time",
+        "finish_time",
+        "is_recovered_oom",
+        "is_released",
+        "_exit_reason",
+        "config_resource",
+        "used_resource",
+        "start_hang_time",
+        "init_time",
+        "eval_time",
+        "host_name",
+        "host_ip",
+        "hang",
+        "paral_config",
+        "restart_training",
+        "migrated",
+        "unrecoverable_failure_msg",
+        "heartbeat_time",
+        "_unrecoverable_msg",
+    )
+
     def __init__(
         self,
         node_type,
@@ -193,18 +308,18 @@ class Node(object):
         self.status = status
         self.start_time = start_time
         self.rank_index = rank_index if rank_index is not None else node_id
-        self.relaunch_count = relaunch_count
+        self._relaunch_count = relaunch_count
         self.critical = critical
-        self.max_relaunch_count = max_relaunch_count
+        self._max_relaunch_count = max_relaunch_count
         self.relaunchable = relaunchable
         self.service_addr = service_addr
         self.create_time = None
         self.finish_time = None
         self.is_recovered_oom = False
         self.is_released = False
-        self.exit_reason = ""
+        self._exit_reason = ""
         self.config_resource = config_resource
-        self.used_resource = NodeResource(0.0, 0.0)
+        self.used_resource = _ZERO_USED_RESOURCE
         self.start_hang_time = 0
         self.init_time = time.time()
         self.eval_time = 0
@@ -216,6 +331,48 @@ class Node(object):
         self.migrated = False
         self.unrecoverable_failure_msg = ""
         self.heartbeat_time = 0
+        self._update_unrecoverable_msg()
+
+    @property
+    def relaunch_count(self):
+        return self._relaunch_count
+
+    @relaunch_count.setter
+    def relaunch_count(self, relaunch_count):
+        self._relaunch_count = relaunch_count
+        self._update_unrecoverable_msg()
+
+    @property
+    def max_relaunch_count(self):
+        return self._max_relaunch_count
+
+    @max_relaunch_count.setter
+    def max_relaunch_count(self, max_relaunch_count):
+        self._max_relaunch_count = max_relaunch_count
+        self._update_unrecoverable_msg()
+
+    @property
+    def exit_reason(self):
+        return self._exit_reason
+
+    @exit_reason.setter
+    def exit_reason(self, exit_reason):
+        self._exit_reason = exit_reason
+        self._update_unrecoverable_msg()
+
+    def _update_unrecoverable_msg(self):
+        """Precompute the unrecoverable failure which only depends on
+        the relaunch count and the exit reason."""
+        if self._relaunch_count >= self._max_relaunch_count:
+            self._unrecoverable_msg = (
+                "exhausted {} relaunch opportunities".format(
+                    self._max_relaunch_count
+                )
+            )
+        elif self._exit_reason == NodeExitReason.FATAL_ERROR:
+            self._unrecoverable_msg = "fatal error"
+        else:
+            self._unrecoverable_msg = ""
 
     def exited(self):
         return self.status in [
@@ -252,6 +409,11 @@ class Node(object):
             self.status = status
 
     def update_resource_usage(self, cpu, memory, gpu_stats=[]):
+        if self.used_resource is _ZERO_USED_RESOURCE:
+            self.used_resource = NodeResource(
+                round(cpu, 2), memory, gpu_stats=gpu_stats
+            )
+            return
         self.used_resource.cpu = round(cpu, 2)
         self.used_resource.memory = memory
         self.used_resource.gpu_stats = gpu_stats
@@ -262,8 +424,36 @@ class Node(object):
     def update_service_address(self, service_addr):
         self.service_addr = service_addr
 
+    def _clone_for_relaunch(self):
+        """Clone the node without `copy.deepcopy`. The `config_resource`
+        and `paral_config` with its dataloader and optimizer configs are
+        copied, the `used_resource` is reset and other fields are shared
+        by reference with the node."""
+        new_node = Node.__new__(Node)
+        for name in Node.__slots__:
+            setattr(new_node, name, getattr(self, name))
+        config_resource = self.config_resource
+        new_node.config_resource = NodeResource(
+            config_resource.cpu,
+            config_resource.memory,
+            config_resource.gpu_type,
+            config_resource.gpu_num,
+            gpu_stats=list(config_resource.gpu_stats),
+            priority=config_resource.priority,
+            **config_resource.kwargs,
+        )
+        new_node.config_resource.image = config_resource.image
+        paral_config = self.paral_config
+        new_node.paral_config = ParallelConfig(
+            dataloader=copy.copy(paral_config.dataloader),
+            optimizer=copy.copy(paral_config.optimizer),
+            restart=paral_config.restart,
+        )
+        new_node.used_resource = _ZERO_USED_RESOURCE
+        return new_node
+
     def get_relaunch_node_info(self, new_id):
-        new_node = copy.deepcopy(self)
+        new_node = self._clone_for_relaunch()
         new_node.id = new_id
         new_node.name = None
         new_node.status = NodeStatus.INITIAL
@@ -276,23 +466,15 @@ class Node(object):
         return new_node
 
     def is_unrecoverable_failure(self):
+        if self._unrecoverable_msg:
+            self.unrecoverable_failure_msg = self._unrecoverable_msg
+            return True
+
         cpu_memory_overload = (
-            self.config_resource.gpu_num == 0
+            self._exit_reason == NodeExitReason.OOM
+            and self.config_resource.gpu_num == 0
             and self.config_resource.memory >= NodeResourceLimit.MAX_MEMORY
-            and self.exit_reason == NodeExitReason.OOM
         )
-        if self.relaunch_count >= self.max_relaunch_count:
-            self.unrecoverable_failure_msg = (
-                "exhausted {} relaunch opportunities".format(
-                    self.max_relaunch_count
-                )
-            )
-            return True
-
-        if self.exit_reason == NodeExitReason.FATAL_ERROR:
-            self.unrecoverable_failure_msg = "fatal error"
-            return True
-
         if cpu_memory_overload:
             self.unrecoverable_failure_msg = (
                 "oom error and can not add more memory"
@@ -313,8 +495,8 @@ class Node(object):
             group_node_num: the number of the group nodes.
         """
         priority = self.config_resource.priority
-        if _is_float_str(priority):
-            fraction = float(priority)
+        fraction = _parse_number(priority)
+        if fraction is not None:
             if fraction <= 0 or fraction > 1:
                 raise ValueError(
                     "If priority is a float, it should be greater than 0 or"
@@ -351,8 +533,13 @@ class Node(object):
         )
 
     def to_dict(self):
-        d = copy.deepcopy(self.__dict__)
-        d.pop("paral_config", None)
-        d.pop("config_resource", None)
-        d.pop("used_resource", None)
-        return d
+        d = {}
+        for name in self.__slots__:
+            if name.startswith("_"):
+                if name not in _NODE_PROPERTY_SLOTS:
+                    continue
+                name = _NODE_PROPERTY_SLOTS[name]
+            elif name in _NODE_UNSERIALIZED_SLOTS:
+                continue
+            d[name] = getattr(self, name)
+        return copy.deepcopy(d)
@@ -26,6 +26,8 @@ def to_dict(o):
 
 
 class JsonSerializable(object):
+    __slots__ = ()
+
     def to_json(self, indent=None):
         return json.dumps(
             self,
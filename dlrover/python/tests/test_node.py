@@ -11,10 +11,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import unittest
 
-from dlrover.python.common.constants import NodeExitReason, NodeResourceLimit
-from dlrover.python.common.node import Node
+from dlrover.python.common.constants import (
+    NodeExitReason,
+    NodeResourceLimit,
+    NodeStatus,
+)
+from dlrover.python.common.node import Node, NodeResource
 
 
 class NodeTest(unittest.TestCase):
@@ -46,3 +51,118 @@ class NodeTest(unittest.TestCase):
         is_unrecoverable = node.is_unrecoverable_failure()
         self.assertEqual(is_unrecoverable, True)
         self.assertEqual("oom" in node.unrecoverable_failure_msg, True)
+
+    def test_get_relaunch_node_info(self):
+        node = Node("worker", 0, NodeResource(4, 8192, priority="high"))
+        node.name = "worker-0"
+        node.status = NodeStatus.FAILED
+        node.relaunch_count = 1
+        node.update_resource_usage(2.0, 4096)
+        new_node = node.get_relaunch_node_info(1)
+        self.assertEqual(new_node.id, 1)
+        self.assertIsNone(new_node.name)
+        self.assertEqual(new_node.status, NodeStatus.INITIAL)
+        self.assertEqual(new_node.relaunch_count, 1)
+        self.assertEqual(new_node.config_resource.memory, 8192)
+        self.assertEqual(new_node.config_resource.priority, "high")
+        self.assertEqual(new_node.used_resource.memory, 0.0)
+        new_node.config_resource.memory = 16384
+        self.assertEqual(node.config_resource.memory, 8192)
+        self.assertIsNot(new_node.paral_config, node.paral_config)
+        self.assertIsNot(
+            new_node.paral_config.dataloader, node.paral_config.dataloader
+        )
+        self.assertIsNot(
+            new_node.paral_config.optimizer, node.paral_config.optimizer
+        )
+        self.assertEqual(new_node.paral_config, node.paral_config)
+
+    def test_resource_str_to_node_resource(self):
+        resource = NodeResource.resource_str_to_node_resource(
+            "cpu=4,memory=2Gi,nvidia.com/gpu=2"
+        )
+        self.assertEqual(resource.cpu, 4.0)
+        self.assertEqual(resource.memory, 2048)
+        self.assertEqual(resource.gpu_type, "nvidia.com/gpu")
+        self.assertEqual(resource.gpu_num, 2)
+
+        resource = NodeResource.resource_str_to_node_resource(
+            "memory=512.5Mi"
+        )
+        self.assertEqual(resource.memory, 512.5)
+
+        resource = NodeResource.resource_str_to_node_resource("memory=100Mi")
+        self.assertEqual(resource.cpu, 0.0)
+        self.assertEqual(resource.memory, 100)
+        self.assertIsNone(resource.gpu_type)
+        self.assertEqual(resource.gpu_num, 0)
+
+    def test_convert_memory_to_mb(self):
+        self.assertEqual(NodeResource.convert_memory_to_mb("2048Ki"), 2)
+        self.assertEqual(NodeResource.convert_memory_to_mb("512Mi"), 512)
+        self.assertEqual(NodeResource.convert_memory_to_mb("2Gi"), 2048)
+        self.assertEqual(NodeResource.convert_memory_to_mb("1024"), 1024)
+        self.assertEqual(NodeResource.convert_memory_to_mb("512.5Mi"), 512.5)
+        self.assertEqual(NodeResource.convert_memory_to_mb("1.5Gi"), 1536.0)
+        self.assertEqual(NodeResource.convert_memory_to_mb("1024.5"), 1024.5)
+        for memory in ["1Ti", "1G", "", "xMi"]:
+            with self.assertRaises(ValueError):
+                NodeResource.convert_memory_to_mb(memory)
+
+    def test_update_resource_usage(self):
+        node0 = Node("worker", 0)
+        node1 = Node("worker", 1)
+        self.assertIs(node0.used_resource, node1.used_resource)
+        node0.update_resource_usage(1.234, 1024)
+        self.assertEqual(node0.used_resource.cpu, 1.23)
+        self.assertEqual(node0.used_resource.memory, 1024)
+        self.assertEqual(node1.used_resource.memory, 0.0)
+        node0.update_resource_usage(2.0, 2048)
+        self.assertEqual(node0.used_resource.memory, 2048)
+        with self.assertRaises(AttributeError):
+            node1.used_resource.cpu = 1.0
+        node_copy = copy.deepcopy(node1)
+        node_copy.used_resource.memory = 1024
+        self.assertEqual(node_copy.used_resource.memory, 1024)
+        self.assertEqual(node1.used_resource.to_dict()["memory"], 0.0)
+        self.assertEqual(node1.used_resource.memory, 0.0)
+
+    def test_update_unrecoverable_failure(self):
+        node = Node("worker", 0, max_relaunch_count=3)
+        self.assertFalse(node.is_unrecoverable_failure())
+        node.relaunch_count += 3
+        self.assertTrue(node.is_unrecoverable_failure())
+        node.max_relaunch_count = 5
+        self.assertFalse(node.is_unrecoverable_failure())
+        node.set_exit_reason(NodeExitReason.FATAL_ERROR)
+        self.assertTrue(node.is_unrecoverable_failure())
+        self.assertEqual(node.unrecoverable_failure_msg, "fatal error")
+        node_dict = node.to_dict()
+        self.assertEqual(node_dict["relaunch_count"], 3)
+        self.assertEqual(node_dict["exit_reason"], NodeExitReason.FATAL_ERROR)
+        self.assertFalse(any(key.startswith("_") for key in node_dict))
+        self.assertNotIn("unrecoverable_msg", node_dict)
+        self.assertNotIn("config_resource", node_dict)
+        self.assertNotIn("used_resource", node_dict)
+        self.assertNotIn("paral_config", node_dict)
+
+    def test_to_resource_dict(self):
+        resource = NodeResource(4, 1024.0, "nvidia.com/gpu", 1)
+        self.assertDictEqual(
+            resource.to_resource_dict(),
+            {"cpu": 4, "memory": "1024Mi", "nvidia.com/gpu": 1},
+        )
+        resource = NodeResource(4, 1024)
+        self.assertDictEqual(
+            resource.to_resource_dict(), {"cpu": 4, "memory": "1024Mi"}
+        )
+        resource = NodeResource(4, 512.5)
+        self.assertDictEqual(
+            resource.to_resource_dict(), {"cpu": 4, "memory": "512.5Mi"}
+        )
+        resource = NodeResource(4, 1024, ephemeral_storage="1Gi")
+        self.assertDictEqual(
+            resource.to_resource_dict(),
+            {"cpu": 4, "memory": "1024Mi", "ephemeral_storage": "1Gi"},
+        )
+        self.assertDictEqual(resource.kwargs, {"ephemeral_storage": "1Gi"})
@@ -62,7 +62,9 @@ class TestLocalStrategyGenerator(unittest.TestCase):
         node_used_resources: Dict[str, List[List[Node]]] = {}
         node_used_resources[NodeType.WORKER] = []
         simple_node = Node(node_type="worker", node_id=0)
-        simple_node.used_resource.gpu_stats = gpu_stats
+        with self.assertRaises(AttributeError):
+            simple_node.used_resource.gpu_stats = gpu_stats
+        simple_node.update_resource_usage(0.0, 0.0, gpu_stats)
         simple_node.paral_config.dataloader = dataloader_config
         simple_node.paral_config.optimizer = optimizer_config
         simple_node.name = "simple_node"